@@ -5,7 +5,12 @@ This module contains functions for healthcare-specific analysis and metrics.
 
 import pandas as pd
 import numpy as np
+from dataclasses import dataclass
+from functools import cached_property
 from scipy import stats
+from numba import njit
+
+from data_processing import PatientTable, _add_columns
 
 def calculate_readmission_rate(df, readmission_col='is_readmission'):
     """
@@ -18,7 +23,17 @@ def calculate_readmission_rate(df, readmission_col='is_readmission'):
     Returns:
     float: Readmission rate as percentage
     """
-    readmission_rate = (df[readmission_col].sum() / len(df)) * 100
+    if len(df) == 0:
+        return np.nan
+    
+    flags = df[readmission_col]
+    if flags.dtype != bool:
+        flags = flags.fillna(False)
+    
+    # Count set bytes in the contiguous bool array (SIMD) instead of a widening sum
+    readmissions = np.count_nonzero(np.ascontiguousarray(flags.to_numpy(dtype=bool)))
+    
+    readmission_rate = (readmissions / len(df)) * 100
     return readmission_rate
 
 def calculate_mortality_rate(df, outcome_col='outcome'):
@@ -26,7 +41,7 @@ def calculate_mortality_rate(df, outcome_col='outcome'):
     Calculate mortality rate
     
     Parameters:
-    df (pd.DataFrame): Patient dataframe
+    df (pd.DataFrame or PatientTable): Patient data
     outcome_col (str): Column name for patient outcome
     
     Returns:
@@ -35,7 +50,30 @@ def calculate_mortality_rate(df, outcome_col='outcome'):
     if outcome_col not in df.columns:
         return None
     
-    mortality_rate = (df[outcome_col] == 'deceased').sum() / len(df) * 100
+    if len(df) == 0:
+        return np.nan
+    
+    outcomes = df[outcome_col]
+    if isinstance(df, PatientTable):
+        # Coded columns compare codes; uncoded ones are plain label arrays
+        labels = df.labels.get(outcome_col)
+        if labels is None:
+            deaths = np.count_nonzero(outcomes == 'deceased')
+        elif 'deceased' in labels:
+            deaths = np.count_nonzero(outcomes == np.flatnonzero(labels == 'deceased')[0])
+        else:
+            deaths = 0
+    elif isinstance(outcomes.dtype, pd.CategoricalDtype):
+        # Compare integer codes rather than strings
+        if 'deceased' in outcomes.cat.categories:
+            deceased_code = outcomes.cat.categories.get_loc('deceased')
+            deaths = np.count_nonzero(outcomes.cat.codes.to_numpy() == deceased_code)
+        else:
+            deaths = 0
+    else:
+        deaths = np.count_nonzero((outcomes == 'deceased').to_numpy())
+    
+    mortality_rate = deaths / len(df) * 100
     return mortality_rate
 
 def calculate_bed_occupancy(df, total_beds, date_col='admission_date'):
@@ -43,65 +81,120 @@ def calculate_bed_occupancy(df, total_beds, date_col='admission_date'):
     Calculate daily bed occupancy rate
     
     Parameters:
-    df (pd.DataFrame): Patient dataframe
+    df (pd.DataFrame or PatientTable): Patient data
     total_beds (int): Total number of available beds
     date_col (str): Column name for date
     
     Returns:
     pd.DataFrame: Daily occupancy rates
     """
-    daily_admissions = df.groupby(date_col).size().reset_index(name='patients')
-    daily_admissions['occupancy_rate'] = (daily_admissions['patients'] / total_beds) * 100
+    if isinstance(df, PatientTable):
+        days = df[date_col].astype('datetime64[D]', copy=False)
+    else:
+        days = df[date_col].to_numpy('datetime64[D]')
+    days = days[~np.isnat(days)]
+    first_day = days.min() if len(days) else np.datetime64('1970-01-01', 'D')
+    
+    # Count admissions per day offset, keeping only days that had admissions
+    patients = np.bincount((days - first_day).astype('i8'))
+    day_offsets = np.flatnonzero(patients)
+    
+    daily_admissions = pd.DataFrame({
+        date_col: (first_day + day_offsets).astype('datetime64[ns]'),
+        'patients': patients[day_offsets]
+    })
+    daily_admissions['occupancy_rate'] = daily_admissions['patients'] * (100.0 / total_beds)
     
     return daily_admissions
 
+def _float_values(df, col):
+    """
+    Column as a float64 array with NaN for missing values, or an empty array if absent
+    
+    Parameters:
+    df (pd.DataFrame or PatientTable): Patient data
+    col (str): Column name
+    
+    Returns:
+    np.ndarray: Column values
+    """
+    if col not in df.columns:
+        return np.empty(0)
+    
+    if isinstance(df, PatientTable):
+        return df[col].astype('float64')
+    
+    return df[col].to_numpy(dtype='float64', na_value=np.nan)
+
+@njit(cache=True)
+def _risk_score_kernel(n, age, los, readmission):
+    """
+    Risk score (0-100) from age, length of stay and readmission history
+    
+    Parameters:
+    n (int): Number of patients
+    age (np.ndarray): Ages, or empty to skip the age component
+    los (np.ndarray): Lengths of stay, or empty to skip the LOS component
+    readmission (np.ndarray): Readmission flags, or empty to skip the history component
+    
+    Returns:
+    np.ndarray: Risk scores
+    """
+    scores = np.zeros(n)
+    
+    for i in range(n):
+        score = 0.0
+        # Age component (0-30 points)
+        if age.shape[0] > 0:
+            score += (age[i] / 120) * 30
+        # Length of stay component (0-30 points), NaN propagates like np.minimum
+        if los.shape[0] > 0:
+            los_ratio = los[i] / 30
+            if los_ratio > 1:
+                los_ratio = 1.0
+            score += los_ratio * 30
+        # Readmission history (0-40 points)
+        if readmission.shape[0] > 0:
+            score += readmission[i] * 40
+        scores[i] = score
+    
+    return scores
+
 def stratify_risk_score(df, los_col='length_of_stay', age_col='age', 
-                       readmission_col='is_readmission'):
+                       readmission_col='is_readmission', inplace=False):
     """
     Calculate risk score for patients
     
     Parameters:
-    df (pd.DataFrame): Patient dataframe
+    df (pd.DataFrame or PatientTable): Patient data
     los_col (str): Column name for length of stay
     age_col (str): Column name for age
     readmission_col (str): Column name for readmission history
+    inplace (bool): Add the columns to df instead of returning a new dataframe
+        (the new dataframe shares df's other columns; copy it before editing those in place)
     
     Returns:
-    pd.DataFrame: Dataframe with risk_score and risk_category columns
+    pd.DataFrame or PatientTable: Data with risk_score and risk_category columns
     """
-    df_copy = df.copy()
-    
-    # Calculate risk score (0-100)
-    risk_score = 0
+    # Calculate risk score (0-100) in one fused pass; absent components contribute nothing
+    risk_score = _risk_score_kernel(
+        len(df),
+        _float_values(df, age_col),
+        _float_values(df, los_col),
+        _float_values(df, readmission_col)
+    )
     
-    # Age component (0-30 points)
-    if age_col in df_copy.columns:
-        age_normalized = (df_copy[age_col] / 120) * 30
-        risk_score += age_normalized
+    # Categorize risk: < 30 Low, < 60 Medium, otherwise High
+    risk_labels = np.array(['Low Risk', 'Medium Risk', 'High Risk'])
+    risk_codes = np.searchsorted([30, 60], risk_score, side='right')
     
-    # Length of stay component (0-30 points)
-    if los_col in df_copy.columns:
-        los_normalized = np.minimum(df_copy[los_col] / 30, 1) * 30
-        risk_score += los_normalized
+    if isinstance(df, PatientTable):
+        return df.with_columns({'risk_score': risk_score, 'risk_category': risk_codes.astype(np.int8)},
+                               labels={'risk_category': risk_labels})
     
-    # Readmission history (0-40 points)
-    if readmission_col in df_copy.columns:
-        risk_score += df_copy[readmission_col].astype(int) * 40
+    risk_category = pd.Categorical.from_codes(risk_codes, categories=risk_labels)
     
-    df_copy['risk_score'] = risk_score
-    
-    # Categorize risk
-    def categorize_risk(score):
-        if score < 30:
-            return 'Low Risk'
-        elif score < 60:
-            return 'Medium Risk'
-        else:
-            return 'High Risk'
-    
-    df_copy['risk_category'] = df_copy['risk_score'].apply(categorize_risk)
-    
-    return df_copy
+    return _add_columns(df, {'risk_score': risk_score, 'risk_category': risk_category}, inplace)
 
 def analyze_treatment_outcomes(df, treatment_col='treatment_type', outcome_col='outcome'):
     """
@@ -115,16 +208,71 @@ def analyze_treatment_outcomes(df, treatment_col='treatment_type', outcome_col='
     Returns:
     pd.DataFrame: Treatment outcome statistics
     """
-    treatment_outcomes = df.groupby([treatment_col, outcome_col]).size().reset_index(name='count')
+    treatment_outcomes = df.groupby([treatment_col, outcome_col], observed=True).size().reset_index(name='count')
     
-    # Calculate success rate for each treatment
-    total_by_treatment = df.groupby(treatment_col).size().reset_index(name='total')
+    # Calculate success rate for each treatment, broadcasting totals back without a merge
+    total_by_treatment = treatment_outcomes.groupby(treatment_col, observed=True)['count'].transform('sum')
     
-    treatment_outcomes = treatment_outcomes.merge(total_by_treatment, on=treatment_col)
-    treatment_outcomes['percentage'] = (treatment_outcomes['count'] / treatment_outcomes['total']) * 100
+    treatment_outcomes['total'] = total_by_treatment
+    treatment_outcomes['percentage'] = treatment_outcomes['count'] * (100.0 / total_by_treatment)
     
     return treatment_outcomes
 
+@njit(cache=True)
+def _group_stats_kernel(codes, values, n_groups):
+    """
+    Per-group mean, median, min, max and count, skipping NaN values and negative codes
+    
+    Parameters:
+    codes (np.ndarray): Group code for each row (-1 for missing keys)
+    values (np.ndarray): Float values to aggregate
+    n_groups (int): Number of groups
+    
+    Returns:
+    tuple: Arrays of means, medians, minimums, maximums and counts per group
+    """
+    sums = np.zeros(n_groups)
+    mins = np.full(n_groups, np.inf)
+    maxs = np.full(n_groups, -np.inf)
+    counts = np.zeros(n_groups, np.int64)
+    
+    for i in range(codes.shape[0]):
+        k = codes[i]
+        v = values[i]
+        if k < 0 or np.isnan(v):
+            continue
+        sums[k] += v
+        counts[k] += 1
+        if v < mins[k]:
+            mins[k] = v
+        if v > maxs[k]:
+            maxs[k] = v
+    
+    # Bucket values by group so each median is a selection over a contiguous slice
+    offsets = np.zeros(n_groups + 1, np.int64)
+    offsets[1:] = np.cumsum(counts)
+    positions = offsets[:-1].copy()
+    bucketed = np.empty(offsets[-1])
+    for i in range(codes.shape[0]):
+        k = codes[i]
+        v = values[i]
+        if k < 0 or np.isnan(v):
+            continue
+        bucketed[positions[k]] = v
+        positions[k] += 1
+    
+    means = np.full(n_groups, np.nan)
+    medians = np.full(n_groups, np.nan)
+    for k in range(n_groups):
+        if counts[k] == 0:
+            mins[k] = np.nan
+            maxs[k] = np.nan
+            continue
+        means[k] = sums[k] / counts[k]
+        medians[k] = np.median(bucketed[offsets[k]:offsets[k + 1]])
+    
+    return means, medians, mins, maxs, counts
+
 def calculate_average_los_by_condition(df, condition_col='diagnosis', los_col='length_of_stay'):
     """
     Calculate average length of stay by medical condition
@@ -137,18 +285,44 @@ def calculate_average_los_by_condition(df, condition_col='diagnosis', los_col='l
     Returns:
     pd.DataFrame: Average LOS by condition
     """
-    los_stats = df.groupby(condition_col)[los_col].agg([
-        ('avg_los', 'mean'),
-        ('median_los', 'median'),
-        ('min_los', 'min'),
-        ('max_los', 'max'),
-        ('patient_count', 'count')
-    ]).reset_index()
+    codes, conditions = pd.factorize(df[condition_col], sort=True)
+    los = df[los_col].to_numpy(dtype='float64', na_value=np.nan)
+    avg_los, median_los, min_los, max_los, patient_count = _group_stats_kernel(
+        codes, los, len(conditions))
+    
+    los_stats = pd.DataFrame({
+        condition_col: conditions,
+        'avg_los': avg_los,
+        'median_los': median_los,
+        'min_los': min_los,
+        'max_los': max_los,
+        'patient_count': patient_count
+    })
     
     los_stats = los_stats.sort_values('avg_los', ascending=False)
     
     return los_stats
 
+def _linear_percentile(values, percentile):
+    """
+    Percentile with linear interpolation (same as pd.Series.quantile) via quickselect
+    
+    Parameters:
+    values (np.ndarray): Non-missing values
+    percentile (float): Percentile between 0 and 100
+    
+    Returns:
+    float: Percentile value, NaN when values is empty
+    """
+    if len(values) == 0:
+        return np.nan
+    
+    position = (len(values) - 1) * (percentile / 100)
+    lower, upper = int(np.floor(position)), int(np.ceil(position))
+    partitioned = np.partition(values, [lower, upper])
+    
+    return partitioned[lower] + (position - lower) * (partitioned[upper] - partitioned[lower])
+
 def identify_high_cost_patients(df, cost_col='total_cost', percentile=90):
     """
     Identify high-cost patients
@@ -164,11 +338,11 @@ def identify_high_cost_patients(df, cost_col='total_cost', percentile=90):
     if cost_col not in df.columns:
         return None
     
-    cost_threshold = df[cost_col].quantile(percentile / 100)
-    high_cost_patients = df[df[cost_col] >= cost_threshold].copy()
-    high_cost_patients['cost_category'] = 'High Cost'
+    costs = df[cost_col].to_numpy(dtype='float64', na_value=np.nan)
+    cost_threshold = _linear_percentile(costs[~np.isnan(costs)], percentile)
+    high_cost_patients = df[costs >= cost_threshold]
     
-    return high_cost_patients
+    return _add_columns(high_cost_patients, {'cost_category': 'High Cost'})
 
 def analyze_seasonal_patterns(df, date_col='admission_date'):
     """
@@ -181,14 +355,26 @@ def analyze_seasonal_patterns(df, date_col='admission_date'):
     Returns:
     dict: Seasonal statistics by month, day of week, etc.
     """
-    df_copy = df.copy()
-    df_copy['month'] = df_copy[date_col].dt.month
-    df_copy['day_of_week'] = df_copy[date_col].dt.dayofweek
-    df_copy['quarter'] = df_copy[date_col].dt.quarter
-    
-    monthly_admissions = df_copy.groupby('month').size().reset_index(name='admissions')
-    daily_admissions = df_copy.groupby('day_of_week').size().reset_index(name='admissions')
-    quarterly_admissions = df_copy.groupby('quarter').size().reset_index(name='admissions')
+    days = df[date_col].to_numpy('datetime64[D]')
+    days = days[~np.isnat(days)]
+    
+    # Date parts from integer arithmetic on the day/month counts since 1970-01-01 (a Thursday)
+    months = days.astype('datetime64[M]').astype('i8') % 12 + 1
+    days_of_week = (days.astype('i8') + 3) % 7
+    quarters = (months - 1) // 3 + 1
+    
+    monthly_admissions = pd.DataFrame({
+        'month': np.arange(1, 13),
+        'admissions': np.bincount(months, minlength=13)[1:]
+    })
+    daily_admissions = pd.DataFrame({
+        'day_of_week': np.arange(7),
+        'admissions': np.bincount(days_of_week, minlength=7)
+    })
+    quarterly_admissions = pd.DataFrame({
+        'quarter': np.arange(1, 5),
+        'admissions': np.bincount(quarters, minlength=5)[1:]
+    })
     
     return {
         'monthly': monthly_admissions,
@@ -196,53 +382,118 @@ def analyze_seasonal_patterns(df, date_col='admission_date'):
         'quarterly': quarterly_admissions
     }
 
-def calculate_comorbidity_index(df, condition_cols):
+def calculate_comorbidity_index(df, condition_cols, inplace=False):
     """
     Calculate comorbidity index (simplified Charlson-like score)
     
     Parameters:
     df (pd.DataFrame): Patient dataframe
     condition_cols (list): List of binary columns for conditions
+    inplace (bool): Add the column to df instead of returning a new dataframe
+        (the new dataframe shares df's other columns; copy it before editing those in place)
     
     Returns:
     pd.DataFrame: Dataframe with comorbidity_index column
     """
-    df_copy = df.copy()
-    
     # Sum the number of conditions
-    df_copy['comorbidity_index'] = df_copy[condition_cols].sum(axis=1)
+    comorbidity_index = df[condition_cols].sum(axis=1)
     
-    return df_copy
+    return _add_columns(df, {'comorbidity_index': comorbidity_index}, inplace)
 
-def predict_readmission_risk(df, features=['age', 'length_of_stay', 'comorbidity_index']):
+@njit(cache=True)
+def _readmission_risk_kernel(n, age, los, comorbidity):
+    """
+    Rule-based readmission probability (0-100) from age, length of stay and comorbidities
+    
+    Parameters:
+    n (int): Number of patients
+    age (np.ndarray): Ages, or empty to skip the age rule
+    los (np.ndarray): Lengths of stay, or empty to skip the LOS rule
+    comorbidity (np.ndarray): Comorbidity indexes, or empty to skip the comorbidity rule
+    
+    Returns:
+    np.ndarray: Predicted readmission risk
+    """
+    risk = np.zeros(n)
+    
+    for i in range(n):
+        points = 0
+        if age.shape[0] > 0 and age[i] > 65:
+            points += 2
+        if los.shape[0] > 0 and los[i] > 7:
+            points += 2
+        if comorbidity.shape[0] > 0 and comorbidity[i] >= 2:
+            points += 3
+        risk[i] = min(points / 7 * 100, 100.0)
+    
+    return risk
+
+def predict_readmission_risk(df, features=['age', 'length_of_stay', 'comorbidity_index'],
+                             inplace=False):
     """
     Simple rule-based readmission risk prediction
     
     Parameters:
     df (pd.DataFrame): Patient dataframe
     features (list): List of feature columns to use
+    inplace (bool): Add the column to df instead of returning a new dataframe
+        (the new dataframe shares df's other columns; copy it before editing those in place)
     
     Returns:
     pd.DataFrame: Dataframe with predicted_readmission_risk column
     """
-    df_copy = df.copy()
-    
-    # Simple scoring system
-    risk_points = 0
-    
-    if 'age' in features and 'age' in df_copy.columns:
-        risk_points += (df_copy['age'] > 65).astype(int) * 2
-    
-    if 'length_of_stay' in features and 'length_of_stay' in df_copy.columns:
-        risk_points += (df_copy['length_of_stay'] > 7).astype(int) * 2
+    # Simple scoring system, converted to a probability in the same pass
+    predicted_risk = _readmission_risk_kernel(
+        len(df),
+        _float_values(df, 'age') if 'age' in features else np.empty(0),
+        _float_values(df, 'length_of_stay') if 'length_of_stay' in features else np.empty(0),
+        _float_values(df, 'comorbidity_index') if 'comorbidity_index' in features else np.empty(0)
+    )
+    
+    return _add_columns(df, {'predicted_readmission_risk': predicted_risk}, inplace)
+
+def _table_department_metrics(table, department_col, los_col, cost_col):
+    """
+    Per-department patient count, average LOS and average cost from coded arrays
     
-    if 'comorbidity_index' in features and 'comorbidity_index' in df_copy.columns:
-        risk_points += (df_copy['comorbidity_index'] >= 2).astype(int) * 3
+    Means are accumulated in float64, so they can differ in the last digits
+    from the float32 means the dataframe path reports for float32 columns.
     
-    # Convert to probability
-    df_copy['predicted_readmission_risk'] = np.minimum(risk_points / 7 * 100, 100)
+    Parameters:
+    table (PatientTable): Patient data
+    department_col (str): Column name for department
+    los_col (str): Column name for length of stay
+    cost_col (str): Column name for cost
     
-    return df_copy
+    Returns:
+    pd.DataFrame: One row per department that has patients
+    """
+    if department_col in table.labels:
+        codes = table[department_col].astype(np.intp)
+        departments = table.labels[department_col]
+    else:
+        # Uncoded columns are plain label arrays; code them in sorted order like groupby
+        codes, departments = pd.factorize(table[department_col], sort=True)
+        departments = np.asarray(departments)
+    has_department = codes >= 0
+    rows = np.bincount(codes[has_department], minlength=len(departments))
+    
+    def group_means(values):
+        valid = has_department & ~np.isnan(values)
+        totals = np.bincount(codes[valid], weights=values[valid], minlength=len(departments))
+        counts = np.bincount(codes[valid], minlength=len(departments))
+        with np.errstate(invalid='ignore'):
+            return totals / counts
+    
+    has_id = has_department & ~pd.isna(table['patient_id'])
+    observed = rows > 0
+    return pd.DataFrame({
+        department_col: departments[observed],
+        'patient_count': np.bincount(codes[has_id], minlength=len(departments))[observed],
+        'avg_los': group_means(_float_values(table, los_col))[observed],
+        'avg_cost': (group_means(_float_values(table, cost_col)) if cost_col in table.columns
+                     else rows)[observed]
+    })
 
 def calculate_department_efficiency(df, department_col='department', 
                                    los_col='length_of_stay', cost_col='total_cost'):
@@ -250,7 +501,7 @@ def calculate_department_efficiency(df, department_col='department',
     Calculate efficiency metrics by department
     
     Parameters:
-    df (pd.DataFrame): Patient dataframe
+    df (pd.DataFrame or PatientTable): Patient data
     department_col (str): Column name for department
     los_col (str): Column name for length of stay
     cost_col (str): Column name for cost
@@ -258,21 +509,149 @@ def calculate_department_efficiency(df, department_col='department',
     Returns:
     pd.DataFrame: Department efficiency metrics
     """
-    efficiency_metrics = df.groupby(department_col).agg({
-        'patient_id': 'count',
-        los_col: 'mean',
-        cost_col: 'mean' if cost_col in df.columns else 'count'
-    }).reset_index()
-    
-    efficiency_metrics.columns = [department_col, 'patient_count', 'avg_los', 'avg_cost']
-    
-    # Calculate efficiency score (lower is better)
+    if isinstance(df, PatientTable):
+        efficiency_metrics = _table_department_metrics(df, department_col, los_col, cost_col)
+    else:
+        efficiency_metrics = df.groupby(department_col, observed=True).agg(
+            patient_count=('patient_id', 'count'),
+            avg_los=(los_col, 'mean'),
+            avg_cost=(cost_col, 'mean') if cost_col in df.columns else (los_col, 'size')
+        ).reset_index()
+    
+    # Calculate efficiency score (lower is better) on the small per-department arrays
     efficiency_metrics['efficiency_score'] = (
-        efficiency_metrics['avg_los'] * efficiency_metrics['avg_cost']
-    ) / efficiency_metrics['patient_count']
+        efficiency_metrics['avg_los'].to_numpy() * efficiency_metrics['avg_cost'].to_numpy()
+    ) / efficiency_metrics['patient_count'].to_numpy()
     
     return efficiency_metrics
 
+@dataclass(eq=False)
+class ClinicalStats:
+    """
+    Lazily computed clinical statistics for one patient dataframe
+    
+    Each statistic is computed on first access and cached, so the plotting
+    functions and the KPI dashboard can share aggregates instead of rescanning
+    the dataframe. Build a new instance if the dataframe changes.
+    
+    Parameters:
+    df (pd.DataFrame): Patient dataframe
+    total_beds (int): Total number of available beds (optional, for bed occupancy)
+    readmission_col (str): Column name for readmission flag
+    risk_col (str): Column name for risk category
+    outcome_col (str): Column name for patient outcome
+    department_col (str): Column name for department
+    condition_col (str): Column name for diagnosis/condition
+    los_col (str): Column name for length of stay
+    cost_col (str): Column name for total cost
+    date_col (str): Column name for admission date
+    """
+    df: pd.DataFrame
+    total_beds: int = None
+    readmission_col: str = 'is_readmission'
+    risk_col: str = 'risk_category'
+    outcome_col: str = 'outcome'
+    department_col: str = 'department'
+    condition_col: str = 'diagnosis'
+    los_col: str = 'length_of_stay'
+    cost_col: str = 'total_cost'
+    date_col: str = 'admission_date'
+    
+    @cached_property
+    def total_patients(self):
+        return len(self.df)
+    
+    @cached_property
+    def readmission_rate(self):
+        if self.readmission_col not in self.df.columns:
+            return None
+        return calculate_readmission_rate(self.df, self.readmission_col)
+    
+    @cached_property
+    def readmission_counts(self):
+        return self.df[self.readmission_col].value_counts()
+    
+    @cached_property
+    def readmission_by_risk(self):
+        if self.risk_col not in self.df.columns:
+            return None
+        return pd.crosstab(self.df[self.risk_col], self.df[self.readmission_col], normalize='index') * 100
+    
+    @cached_property
+    def mortality_rate(self):
+        return calculate_mortality_rate(self.df, self.outcome_col)
+    
+    @cached_property
+    def avg_los(self):
+        if self.los_col not in self.df.columns:
+            return None
+        return self.df[self.los_col].mean()
+    
+    @cached_property
+    def avg_cost(self):
+        if self.cost_col not in self.df.columns:
+            return None
+        return self.df[self.cost_col].mean()
+    
+    @cached_property
+    def high_cost_threshold(self):
+        if self.cost_col not in self.df.columns:
+            return None
+        costs = self.df[self.cost_col].to_numpy(dtype='float64', na_value=np.nan)
+        return _linear_percentile(costs[~np.isnan(costs)], 90)
+    
+    @cached_property
+    def high_risk_count(self):
+        if self.risk_col not in self.df.columns:
+            return None
+        return int((self.df[self.risk_col] == 'High Risk').sum())
+    
+    @cached_property
+    def bed_occupancy(self):
+        if self.total_beds is None:
+            return None
+        return calculate_bed_occupancy(self.df, self.total_beds, self.date_col)['occupancy_rate'].mean()
+    
+    @cached_property
+    def avg_los_by_condition(self):
+        return calculate_average_los_by_condition(self.df, self.condition_col, self.los_col)
+    
+    @cached_property
+    def department_groups(self):
+        return self.df.groupby(self.department_col, observed=True, sort=False)
+    
+    @cached_property
+    def department_summary(self):
+        """
+        Patient count, average LOS and average cost (if available) per department
+        """
+        aggregations = {'avg_los': (self.los_col, 'mean')}
+        if self.cost_col in self.df.columns:
+            aggregations['avg_cost'] = (self.cost_col, 'mean')
+        
+        summary = self.department_groups.agg(**aggregations)
+        summary.insert(0, 'patient_count', self.department_groups.size())
+        return summary
+    
+    @cached_property
+    def los_by_department(self):
+        return {dept: los.to_numpy() for dept, los in self.department_groups[self.los_col]}
+    
+    @cached_property
+    def kpis(self):
+        """
+        Metrics dictionary in the format expected by create_kpi_dashboard()
+        """
+        kpis = {
+            'total_patients': self.total_patients,
+            'avg_los': self.avg_los,
+            'readmission_rate': self.readmission_rate,
+            'bed_occupancy': self.bed_occupancy,
+            'high_risk_count': self.high_risk_count,
+            'avg_cost': self.avg_cost,
+        }
+        return {key: value for key, value in kpis.items() if value is not None}
+
 if __name__ == "__main__":
     print("Clinical Analysis Module loaded successfully!")
     print("\nAvailable functions:")
@@ -287,3 +666,4 @@ if __name__ == "__main__":
     print("- calculate_comorbidity_index()")
     print("- predict_readmission_risk()")
     print("- calculate_department_efficiency()")
+    print("- ClinicalStats")
@@ -5,20 +5,233 @@ This module contains functions for cleaning and preprocessing healthcare data.
 
 import pandas as pd
 import numpy as np
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from numba import njit
 
-def load_patient_data(filepath):
+NS_PER_DAY = 86_400_000_000_000
+NAT = np.iinfo(np.int64).min
+
+DATE_COLUMNS = ['admission_date', 'discharge_date', 'birth_date']
+CATEGORICAL_COLUMNS = ['outcome', 'gender', 'department', 'diagnosis', 'treatment_type']
+
+# Default dtypes for the patient CSV; date columns are parsed separately
+PATIENT_SCHEMA = {
+    'age': 'float32',
+    'length_of_stay': 'float32',
+    'total_cost': 'float32',
+    **{col: 'category' for col in CATEGORICAL_COLUMNS},
+}
+
+def _add_columns(df, columns, inplace=False):
+    """
+    Set columns on df, or on a shallow copy that shares all other columns with df
+    
+    The copy only gets new arrays for the columns being set; every other column
+    still points at df's data, so editing one of those in place (e.g. with
+    .loc or .values) also changes df. Call .copy() on the result first if that
+    is needed.
+    
+    Parameters:
+    df (pd.DataFrame): Patient dataframe
+    columns (dict): Mapping of column name to values
+    inplace (bool): Modify df directly instead of a shallow copy
+    
+    Returns:
+    pd.DataFrame: Dataframe with the columns set
+    """
+    if not inplace:
+        df = df.copy(deep=False)
+    
+    for name, values in columns.items():
+        df[name] = values
+    
+    return df
+
+@dataclass
+class PatientTable:
+    """
+    Column-oriented patient data held as one flat numpy array per column
+    
+    Label columns are stored as small integer codes with their labels kept in
+    `labels`, dates as datetime64[D] (or datetime64[ns] when they carry a time
+    of day) and numeric columns in the narrowest suitable dtype. Functions that
+    accept a PatientTable work on the arrays directly; call to_pandas() only
+    where a dataframe is needed.
+    
+    Parameters:
+    columns (dict): Mapping of column name to np.ndarray (all the same length)
+    labels (dict): Mapping of coded column name to its array of labels
+    """
+    columns: dict
+    labels: dict = field(default_factory=dict)
+    
+    @classmethod
+    def from_dataframe(cls, df):
+        """
+        Build a PatientTable from a (cleaned) patient dataframe
+        
+        Parameters:
+        df (pd.DataFrame): Patient dataframe
+        
+        Returns:
+        PatientTable: Column-oriented copy of the data
+        """
+        columns, labels = {}, {}
+        
+        for col in df.columns:
+            values = df[col]
+            if isinstance(values.dtype, pd.CategoricalDtype) or col in CATEGORICAL_COLUMNS:
+                if isinstance(values.dtype, pd.CategoricalDtype):
+                    codes, uniques = values.cat.codes.to_numpy(), values.cat.categories
+                else:
+                    codes, uniques = pd.factorize(values, sort=True)
+                columns[col] = codes.astype(np.int8 if len(uniques) < 128 else np.int32)
+                labels[col] = np.asarray(uniques)
+            elif pd.api.types.is_datetime64_any_dtype(values):
+                # Whole days only when no time of day would be lost
+                stamps = values.to_numpy('datetime64[ns]')
+                days = stamps.astype('datetime64[D]')
+                columns[col] = days if np.all((days == stamps) | np.isnat(stamps)) else stamps
+            elif col in ('age', 'length_of_stay'):
+                # int16 only when every value is a whole number it can hold
+                floats = values.to_numpy(dtype='float64', na_value=np.nan)
+                whole = np.all((floats == np.round(floats)) & (np.abs(floats) <= np.iinfo(np.int16).max))
+                columns[col] = floats.astype(np.int16 if whole else np.float32)
+            elif col == 'total_cost':
+                columns[col] = values.to_numpy(dtype=np.float32, na_value=np.nan)
+            else:
+                columns[col] = values.to_numpy()
+        
+        return cls(columns, labels)
+    
+    @property
+    def shape(self):
+        return (len(self), len(self.columns))
+    
+    def __len__(self):
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+    
+    def __contains__(self, col):
+        return col in self.columns
+    
+    def __getitem__(self, col):
+        return self.columns[col]
+    
+    def take(self, indices):
+        """
+        Select rows by position from every column
+        
+        Parameters:
+        indices (np.ndarray): Row positions
+        
+        Returns:
+        PatientTable: Table with the selected rows
+        """
+        return PatientTable({col: values[indices] for col, values in self.columns.items()},
+                            dict(self.labels))
+    
+    def with_columns(self, columns, labels=None):
+        """
+        Add or replace columns, sharing all other arrays with this table
+        
+        Parameters:
+        columns (dict): Mapping of column name to np.ndarray
+        labels (dict): Labels for any coded columns being added (optional)
+        
+        Returns:
+        PatientTable: New table with the columns set
+        """
+        return PatientTable({**self.columns, **columns}, {**self.labels, **(labels or {})})
+    
+    def to_pandas(self):
+        """
+        Convert to a dataframe, decoding label columns back to categoricals
+        
+        Returns:
+        pd.DataFrame: Patient dataframe
+        """
+        data = {}
+        for col, values in self.columns.items():
+            if col in self.labels:
+                data[col] = pd.Categorical.from_codes(values, categories=self.labels[col])
+            elif values.dtype.kind == 'M':
+                data[col] = values.astype('datetime64[ns]')
+            else:
+                data[col] = values
+        
+        return pd.DataFrame(data)
+
+@njit(cache=True)
+def _readmission_kernel(patient_codes, admissions, discharges, days, ticks_per_day):
+    """
+    Flag rows admitted 1 to `days` whole days after the patient's previous discharge
+    
+    Parameters:
+    patient_codes (np.ndarray): Integer patient codes, sorted so each patient is contiguous
+    admissions (np.ndarray): Admission timestamps as int64 ticks
+    discharges (np.ndarray): Discharge timestamps as int64 ticks
+    days (int): Number of days to check for readmission
+    ticks_per_day (int): Timestamp ticks in one day (NS_PER_DAY for nanoseconds)
+    
+    Returns:
+    np.ndarray: Boolean readmission flags
+    """
+    n = patient_codes.shape[0]
+    flags = np.zeros(n, np.bool_)
+    # Same bounds as 0 < (admission - previous discharge).days <= days
+    lower = np.int64(ticks_per_day)
+    upper = np.int64(days + 1) * ticks_per_day
+    
+    for i in range(1, n):
+        if patient_codes[i] < 0 or patient_codes[i] != patient_codes[i - 1]:
+            continue
+        if admissions[i] == NAT or discharges[i - 1] == NAT:
+            continue
+        gap = admissions[i] - discharges[i - 1]
+        flags[i] = lower <= gap < upper
+    
+    return flags
+
+def _calendar_key(days):
+    """
+    Sortable (year, month, day of month) key for datetime64[D] values
+    
+    Parameters:
+    days (np.ndarray): datetime64[D] values
+    
+    Returns:
+    np.ndarray: months_since_1970 * 32 + day_index, so one year spans 12 * 32
+    """
+    # One cast to months; the year and month fall out of the integer month count
+    months = days.astype('datetime64[M]')
+    
+    return months.astype('i8') * 32 + (days - months).astype('i8')
+
+def load_patient_data(filepath, schema=None, engine='pyarrow'):
     """
     Load patient data from CSV file
     
     Parameters:
-    filepath (str): Path to the CSV file
+    filepath (str or file-like): Path, URL or open buffer holding the CSV
+    schema (dict): Column dtypes to apply after reading (default: PATIENT_SCHEMA)
+    engine (str): pd.read_csv parser engine (default: multi-threaded pyarrow)
     
     Returns:
     pd.DataFrame: Loaded dataframe
     """
-    df = pd.read_csv(filepath)
-    return df
+    if schema is None:
+        schema = PATIENT_SCHEMA
+    
+    # Read once (file handles, buffers and URLs can't be rewound reliably),
+    # then apply the schema to whichever of its columns the file has
+    df = pd.read_csv(filepath, engine=engine)
+    df = df.astype({col: dtype for col, dtype in schema.items() if col in df.columns})
+    return _add_columns(df, {
+        col: pd.to_datetime(df[col], errors='coerce')
+        for col in DATE_COLUMNS
+        if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col])
+    }, inplace=True)
 
 def clean_patient_data(df):
     """
@@ -30,28 +243,32 @@ def clean_patient_data(df):
     Returns:
     pd.DataFrame: Cleaned dataframe
     """
-    # Make a copy
-    df_clean = df.copy()
-    
-    # Convert date columns to datetime
-    date_columns = ['admission_date', 'discharge_date', 'birth_date']
-    for col in date_columns:
-        if col in df_clean.columns:
-            df_clean[col] = pd.to_datetime(df_clean[col], errors='coerce')
+    # Convert date columns not already parsed at load time (other columns are shared, not copied)
+    df_clean = _add_columns(df, {
+        col: pd.to_datetime(df[col], errors='coerce')
+        for col in DATE_COLUMNS
+        if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col])
+    })
+    
+    # Keep the first of any duplicates, rows with an ID and admission date,
+    # and valid ages (0 to 120); the rows are materialized once at the end
+    keep = ~df_clean.duplicated(subset=['patient_id', 'admission_date'], keep='first')
+    keep &= df_clean['patient_id'].notna() & df_clean['admission_date'].notna()
     
-    # Remove duplicates
-    df_clean = df_clean.drop_duplicates(subset=['patient_id', 'admission_date'], keep='first')
+    if 'age' in df_clean.columns:
+        keep &= df_clean['age'].between(0, 120, inclusive='both')
     
-    # Handle missing values
-    df_clean = df_clean.dropna(subset=['patient_id', 'admission_date'])
+    df_clean = df_clean.loc[keep]
     
-    # Remove invalid ages (negative or > 120)
-    if 'age' in df_clean.columns:
-        df_clean = df_clean[(df_clean['age'] >= 0) & (df_clean['age'] <= 120)]
+    # Store low-cardinality labels as categoricals so comparisons and groupbys run on integer codes
+    df_clean = _add_columns(df_clean, {
+        col: df_clean[col].astype('category')
+        for col in CATEGORICAL_COLUMNS if col in df_clean.columns
+    })
     
     return df_clean
 
-def calculate_patient_age(df, birth_date_col='birth_date', reference_date=None):
+def calculate_patient_age(df, birth_date_col='birth_date', reference_date=None, inplace=True):
     """
     Calculate patient age from birth date
     
@@ -59,16 +276,33 @@ def calculate_patient_age(df, birth_date_col='birth_date', reference_date=None):
     df (pd.DataFrame): Patient dataframe
     birth_date_col (str): Column name for birth date
     reference_date (datetime): Date to calculate age from (default: today)
+    inplace (bool): Add the column to df (default, like the other steps in this
+        module); if False, return a new dataframe that shares df's other columns
+        (copy it before editing those in place)
     
     Returns:
-    pd.DataFrame: Dataframe with age column added
+    pd.DataFrame: Dataframe with age column added (int16, or float32 with NaN
+        when some birth dates are missing)
     """
     if reference_date is None:
         reference_date = datetime.now()
     
-    df['age'] = (reference_date - df[birth_date_col]).dt.days // 365
+    reference_day = np.array([pd.Timestamp(reference_date).to_datetime64()], dtype='datetime64[D]')
+    birth_days = df[birth_date_col].to_numpy('datetime64[D]')
     
-    return df
+    # Whole years between the dates: the (month, day) part of the key difference
+    # stays within one year, so flooring by a year's span drops a year exactly
+    # when the birthday hasn't come yet
+    age = (_calendar_key(reference_day) - _calendar_key(birth_days)) // (12 * 32)
+    
+    missing = np.isnat(birth_days)
+    if missing.any():
+        age = age.astype(np.float32)
+        age[missing] = np.nan
+    else:
+        age = age.astype(np.int16)
+    
+    return _add_columns(df, {'age': age}, inplace)
 
 def calculate_length_of_stay(df, admission_col='admission_date', discharge_col='discharge_date'):
     """
@@ -101,10 +335,14 @@ def categorize_age_groups(df, age_col='age'):
     Returns:
     pd.DataFrame: Dataframe with age_group column added
     """
-    bins = [0, 18, 35, 50, 65, 80, 120]
+    bins = np.array([0, 18, 35, 50, 65, 80, 120])
     labels = ['0-17', '18-34', '35-49', '50-64', '65-79', '80+']
     
-    df['age_group'] = pd.cut(df[age_col], bins=bins, labels=labels, right=False)
+    # Left-closed bins; ages outside [0, 120) and missing ages get code -1 (NaN)
+    codes = np.searchsorted(bins, df[age_col].to_numpy(dtype='float64', na_value=np.nan), side='right') - 1
+    codes[codes >= len(labels)] = -1
+    
+    df['age_group'] = pd.Categorical.from_codes(codes, categories=labels, ordered=True)
     
     return df
 
@@ -114,46 +352,65 @@ def identify_readmissions(df, patient_id_col='patient_id', discharge_col='discha
     Identify readmissions within specified days
     
     Parameters:
-    df (pd.DataFrame): Patient dataframe
+    df (pd.DataFrame or PatientTable): Patient data
     patient_id_col (str): Column name for patient ID
     discharge_col (str): Column name for discharge date
     admission_col (str): Column name for admission date
     days (int): Number of days to check for readmission
     
     Returns:
-    pd.DataFrame: Dataframe with readmission flag column added
+    pd.DataFrame or PatientTable: Data sorted by patient and admission date,
+        with readmission flag column added
     """
-    # Sort by patient and admission date
-    df_sorted = df.sort_values([patient_id_col, admission_col])
+    if isinstance(df, PatientTable):
+        # Sort on integer patient codes, missing IDs last as in sort_values
+        codes, unique_ids = pd.factorize(df[patient_id_col], sort=True)
+        order = np.lexsort((df[admission_col], np.where(codes < 0, len(unique_ids), codes)))
+        table = df.take(order)
+        patient_codes = codes[order]
+        
+        # Dates are datetime64[D], or [ns] when they carry a time of day; bring
+        # both columns to the finer unit and scale the day bounds to match
+        dtype = np.promote_types(table[admission_col].dtype, table[discharge_col].dtype)
+        ticks_per_day = np.timedelta64(1, 'D') // np.timedelta64(1, np.datetime_data(dtype)[0])
+        admissions = table[admission_col].astype(dtype, copy=False).view('i8')
+        discharges = table[discharge_col].astype(dtype, copy=False).view('i8')
+        is_readmission = _readmission_kernel(patient_codes, admissions, discharges,
+                                             days, ticks_per_day)
+        return table.with_columns({'is_readmission': is_readmission})
     
-    # Calculate days since last discharge for each patient
-    df_sorted['previous_discharge'] = df_sorted.groupby(patient_id_col)[discharge_col].shift(1)
-    df_sorted['days_since_discharge'] = (df_sorted[admission_col] - df_sorted['previous_discharge']).dt.days
+    # Sort by patient and admission date
+    df_sorted = df.sort_values([patient_id_col, admission_col], kind='stable')
     
-    # Flag readmissions
-    df_sorted['is_readmission'] = (df_sorted['days_since_discharge'] <= days) & (df_sorted['days_since_discharge'] > 0)
-    df_sorted['is_readmission'] = df_sorted['is_readmission'].fillna(False)
+    # Flag readmissions in a single pass over the sorted arrays
+    patient_codes = pd.factorize(df_sorted[patient_id_col])[0]
+    admissions = df_sorted[admission_col].to_numpy('datetime64[ns]').view('i8')
+    discharges = df_sorted[discharge_col].to_numpy('datetime64[ns]').view('i8')
+    is_readmission = _readmission_kernel(patient_codes, admissions, discharges, days, NS_PER_DAY)
     
-    return df_sorted
+    return _add_columns(df_sorted, {'is_readmission': is_readmission}, inplace=True)
 
-def anonymize_patient_data(df, patient_id_col='patient_id'):
+def anonymize_patient_data(df, patient_id_col='patient_id', inplace=True):
     """
     Anonymize patient IDs for privacy
     
     Parameters:
     df (pd.DataFrame): Patient dataframe
     patient_id_col (str): Column name for patient ID
+    inplace (bool): Add the column to df (default, like the other steps in this
+        module); if False, return a new dataframe that shares df's other columns
+        (copy it before editing those in place)
     
     Returns:
     pd.DataFrame: Dataframe with anonymized patient IDs
     """
-    # Create mapping of original IDs to anonymized IDs
-    unique_ids = df[patient_id_col].unique()
-    id_mapping = {old_id: f'PAT_{i:06d}' for i, old_id in enumerate(unique_ids, 1)}
+    # Number patients in order of first appearance, then gather their labels by code
+    codes, unique_ids = pd.factorize(df[patient_id_col], use_na_sentinel=False)
+    id_labels = np.char.add('PAT_', np.char.zfill(np.arange(1, len(unique_ids) + 1).astype(str), 6))
     
-    df['anonymized_id'] = df[patient_id_col].map(id_mapping)
+    anonymized_ids = id_labels[codes]
     
-    return df
+    return _add_columns(df, {'anonymized_id': anonymized_ids}, inplace)
 
 def aggregate_by_department(df, department_col='department', metric_cols=['length_of_stay']):
     """
@@ -169,7 +426,7 @@ def aggregate_by_department(df, department_col='department', metric_cols=['lengt
     """
     agg_dict = {col: ['mean', 'median', 'count', 'std'] for col in metric_cols}
     
-    dept_stats = df.groupby(department_col).agg(agg_dict).reset_index()
+    dept_stats = df.groupby(department_col, observed=True).agg(agg_dict).reset_index()
     
     # Flatten column names
     dept_stats.columns = ['_'.join(col).strip('_') for col in dept_stats.columns.values]
@@ -187,3 +444,4 @@ if __name__ == "__main__":
     print("- identify_readmissions()")
     print("- anonymize_patient_data()")
     print("- aggregate_by_department()")
+    print("- PatientTable")
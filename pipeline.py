@@ -0,0 +1,116 @@
+"""
+Healthcare Pipeline Module
+This module chains the processing and clinical analysis steps and runs them in parallel with Dask.
+"""
+
+import numpy as np
+import dask.dataframe as dd
+
+from data_processing import (PATIENT_SCHEMA, DATE_COLUMNS, clean_patient_data,
+                             calculate_patient_age, calculate_length_of_stay,
+                             identify_readmissions)
+from clinical_analysis import (stratify_risk_score, calculate_comorbidity_index,
+                               predict_readmission_risk)
+
+def process_patient_partition(df, condition_cols=None, reference_date=None):
+    """
+    Run the clinical pipeline on a dataframe holding complete patient histories
+    
+    Parameters:
+    df (pd.DataFrame): Raw patient dataframe
+    condition_cols (list): Binary condition columns for the comorbidity index (optional)
+    reference_date (datetime): Date to calculate age from (default: today)
+    
+    Returns:
+    pd.DataFrame: Cleaned dataframe with age, LOS, readmission and risk columns
+    """
+    df = clean_patient_data(df)
+    
+    if 'birth_date' in df.columns:
+        df = calculate_patient_age(df, reference_date=reference_date, inplace=True)
+    
+    df = calculate_length_of_stay(df)
+    df = identify_readmissions(df)
+    df = stratify_risk_score(df, inplace=True)
+    
+    if condition_cols:
+        df = calculate_comorbidity_index(df, condition_cols, inplace=True)
+    
+    df = predict_readmission_risk(df, inplace=True)
+    
+    return df
+
+def _number_rows(df, partition_info=None):
+    """
+    Tag each row with its position in the input (CSV block number, row within block)
+    
+    Parameters:
+    df (pd.DataFrame): One partition of the raw patient data
+    partition_info (dict): Partition metadata supplied by Dask
+    
+    Returns:
+    pd.DataFrame: Partition with a _file_order column added
+    """
+    block = partition_info['number'] if partition_info else 0
+    return df.assign(_file_order=(block << 32) + np.arange(len(df)))
+
+def _process_shard(df, condition_cols, reference_date):
+    """
+    Restore file order within a shuffled partition, then run the pipeline on it
+    
+    Parameters:
+    df (pd.DataFrame): One patient-indexed partition
+    condition_cols (list): Binary condition columns for the comorbidity index (optional)
+    reference_date (datetime): Date to calculate age from (default: today)
+    
+    Returns:
+    pd.DataFrame: Processed partition, indexed by patient ID again so the
+        collection's patient_id divisions still hold, with age as float32
+    """
+    df = df.reset_index().sort_values('_file_order', kind='stable').drop(columns='_file_order')
+    df = process_patient_partition(df, condition_cols, reference_date).set_index('patient_id')
+    
+    # Age is int16 or float32 depending on whether the shard has missing birth
+    # dates; fix it to the schema dtype so every shard matches the collection
+    if 'age' in df.columns:
+        df['age'] = df['age'].astype(PATIENT_SCHEMA['age'])
+    
+    return df
+
+def build_pipeline(filepath, npartitions=None, condition_cols=None, reference_date=None):
+    """
+    Build a lazy Dask pipeline over patient CSV files, partitioned by patient ID
+    
+    Parameters:
+    filepath (str): Path or glob pattern of the CSV file(s)
+    npartitions (int): Number of patient partitions (default: one per CSV block)
+    condition_cols (list): Binary condition columns for the comorbidity index (optional)
+    reference_date (datetime): Date to calculate age from (default: today)
+    
+    Returns:
+    dd.DataFrame: Processed dataframe indexed by patient_id; call .compute() to run it
+    """
+    # The pyarrow parser rejects dtypes for columns the file lacks, so take the
+    # header from Dask's byte sample first (paths and globs can be re-read).
+    # Dates are read as text and coerced, so a malformed value becomes NaT
+    # (and is dropped or ignored downstream) instead of failing the whole run
+    columns = dd.read_csv(filepath, engine='pyarrow').columns
+    schema = {**PATIENT_SCHEMA, **dict.fromkeys(DATE_COLUMNS, object)}
+    ddf = dd.read_csv(filepath, engine='pyarrow',
+                      dtype={col: dtype for col, dtype in schema.items() if col in columns})
+    ddf = ddf.assign(**{col: dd.to_datetime(ddf[col], errors='coerce')
+                        for col in DATE_COLUMNS if col in ddf.columns})
+    
+    # One shuffle so every patient's admissions land in a single partition;
+    # per-patient steps such as readmission flagging then run partition-local.
+    # File order is kept so duplicate admissions resolve as in clean_patient_data
+    ddf = ddf.map_partitions(_number_rows)
+    ddf = ddf.set_index('patient_id', npartitions=npartitions)
+    
+    return ddf.map_partitions(_process_shard, condition_cols, reference_date)
+
+if __name__ == "__main__":
+    print("Healthcare Pipeline Module loaded successfully!")
+    print("\nAvailable functions:")
+    print("- process_patient_partition()")
+    print("- build_pipeline()")
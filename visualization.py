@@ -8,6 +8,8 @@ import seaborn as sns
 import numpy as np
 import pandas as pd
 
+from clinical_analysis import ClinicalStats
+
 # Set style
 sns.set_style("whitegrid")
 plt.rcParams['figure.figsize'] = (12, 6)
@@ -65,7 +67,11 @@ def plot_admission_trends(df, date_col='admission_date', title='Hospital Admissi
            linewidth=2, color='#2ecc71', marker='o', markersize=4)
     
     # Add 7-day moving average
-    daily_admissions['ma_7'] = daily_admissions['admissions'].rolling(window=7).mean()
+    # Window sums as differences of a running total (first 6 days have no full window)
+    admissions_total = np.concatenate([[0], np.cumsum(daily_admissions['admissions'].to_numpy())])
+    ma_7 = np.full(len(daily_admissions), np.nan)
+    ma_7[6:] = (admissions_total[7:] - admissions_total[:-7]) / 7.0
+    daily_admissions['ma_7'] = ma_7
     ax.plot(daily_admissions['date'], daily_admissions['ma_7'], 
            linewidth=2, color='#e74c3c', linestyle='--', label='7-Day Moving Average')
     
@@ -93,12 +99,22 @@ def plot_length_of_stay_distribution(df, los_col='length_of_stay', department_co
     """
     fig, ax = plt.subplots(figsize=(12, 8))
     
-    departments = df[department_col].unique()
+    dept_codes, departments = pd.factorize(df[department_col])
     colors = plt.cm.Set3(np.linspace(0, 1, len(departments)))
     
-    for i, dept in enumerate(departments):
-        dept_data = df[df[department_col] == dept][los_col]
-        ax.hist(dept_data, bins=20, alpha=0.6, label=dept, color=colors[i], edgecolor='black')
+    # Histogram every department in one pass over shared LOS bins
+    # (an empty frame has no departments and just gets an empty axis)
+    if len(departments):
+        los = df[los_col].to_numpy(dtype='float64', na_value=np.nan)
+        valid = ~np.isnan(los) & (dept_codes >= 0)
+        los, dept_codes = los[valid], dept_codes[valid]
+        los_range = [los.min(), los.max()] if len(los) else [0, 1]
+        counts, los_edges, _ = np.histogram2d(los, dept_codes, bins=[20, len(departments)],
+                                              range=[los_range, [0, len(departments)]])
+        
+        for i, dept in enumerate(departments):
+            ax.stairs(counts[:, i], los_edges, fill=True, alpha=0.6, label=dept,
+                      color=colors[i], edgecolor='black')
     
     ax.set_xlabel('Length of Stay (days)', fontsize=12)
     ax.set_ylabel('Number of Patients', fontsize=12)
@@ -114,24 +130,30 @@ def plot_readmission_analysis(df, readmission_col='is_readmission', risk_col='ri
     Plot readmission analysis
     
     Parameters:
-    df (pd.DataFrame): Patient dataframe
+    df (pd.DataFrame or ClinicalStats): Patient dataframe, or cached statistics
+        (column names are then taken from the ClinicalStats)
     readmission_col (str): Column name for readmission flag
     risk_col (str): Column name for risk category
     
     Returns:
     matplotlib.figure.Figure: The created figure
     """
+    if isinstance(df, ClinicalStats):
+        clinical_stats = df
+    else:
+        clinical_stats = ClinicalStats(df, readmission_col=readmission_col, risk_col=risk_col)
+    
     fig, axes = plt.subplots(1, 2, figsize=(14, 6))
     
     # Readmission rate pie chart
-    readmission_counts = df[readmission_col].value_counts()
+    readmission_counts = clinical_stats.readmission_counts
     axes[0].pie(readmission_counts, labels=['No Readmission', 'Readmission'],
                autopct='%1.1f%%', colors=['#2ecc71', '#e74c3c'], startangle=90)
     axes[0].set_title('Overall Readmission Rate', fontsize=14, fontweight='bold')
     
     # Readmission by risk category
-    if risk_col in df.columns:
-        risk_readmission = pd.crosstab(df[risk_col], df[readmission_col], normalize='index') * 100
+    risk_readmission = clinical_stats.readmission_by_risk
+    if risk_readmission is not None:
         risk_readmission.plot(kind='bar', stacked=True, ax=axes[1], 
                              color=['#2ecc71', '#e74c3c'], alpha=0.8)
         axes[1].set_xlabel('Risk Category', fontsize=12)
@@ -150,7 +172,8 @@ def plot_department_performance(df, department_col='department',
     Plot department performance metrics
     
     Parameters:
-    df (pd.DataFrame): Patient dataframe
+    df (pd.DataFrame or ClinicalStats): Patient dataframe, or cached statistics
+        (column names are then taken from the ClinicalStats)
     department_col (str): Column name for department
     los_col (str): Column name for length of stay
     cost_col (str): Column name for cost
@@ -158,33 +181,41 @@ def plot_department_performance(df, department_col='department',
     Returns:
     matplotlib.figure.Figure: The created figure
     """
+    if isinstance(df, ClinicalStats):
+        clinical_stats = df
+    else:
+        clinical_stats = ClinicalStats(df, department_col=department_col,
+                                       los_col=los_col, cost_col=cost_col)
+    
     fig, axes = plt.subplots(2, 2, figsize=(14, 10))
     
     # Patient volume by department
-    dept_counts = df[department_col].value_counts().sort_values()
+    department_summary = clinical_stats.department_summary
+    dept_counts = department_summary['patient_count'].sort_values()
     axes[0, 0].barh(dept_counts.index, dept_counts.values, color='#3498db', alpha=0.8)
     axes[0, 0].set_xlabel('Number of Patients', fontsize=11)
     axes[0, 0].set_title('Patient Volume by Department', fontsize=12, fontweight='bold')
     axes[0, 0].grid(axis='x', alpha=0.3)
     
     # Average LOS by department
-    avg_los = df.groupby(department_col)[los_col].mean().sort_values()
+    avg_los = department_summary['avg_los'].sort_values()
     axes[0, 1].barh(avg_los.index, avg_los.values, color='#2ecc71', alpha=0.8)
     axes[0, 1].set_xlabel('Average Length of Stay (days)', fontsize=11)
     axes[0, 1].set_title('Average LOS by Department', fontsize=12, fontweight='bold')
     axes[0, 1].grid(axis='x', alpha=0.3)
     
     # Average cost by department (if available)
-    if cost_col in df.columns:
-        avg_cost = df.groupby(department_col)[cost_col].mean().sort_values()
+    if 'avg_cost' in department_summary.columns:
+        avg_cost = department_summary['avg_cost'].sort_values()
         axes[1, 0].barh(avg_cost.index, avg_cost.values, color='#e74c3c', alpha=0.8)
         axes[1, 0].set_xlabel('Average Cost ($)', fontsize=11)
         axes[1, 0].set_title('Average Cost by Department', fontsize=12, fontweight='bold')
         axes[1, 0].grid(axis='x', alpha=0.3)
     
-    # LOS box plot by department
-    departments = df[department_col].unique()
-    los_data = [df[df[department_col] == dept][los_col].values for dept in departments]
+    # LOS box plot by department, reusing the grouping behind the summary above
+    los_by_department = clinical_stats.los_by_department
+    departments = list(los_by_department.keys())
+    los_data = list(los_by_department.values())
     axes[1, 1].boxplot(los_data, labels=departments, patch_artist=True)
     axes[1, 1].set_ylabel('Length of Stay (days)', fontsize=11)
     axes[1, 1].set_title('LOS Distribution by Department', fontsize=12, fontweight='bold')
@@ -283,11 +314,15 @@ def create_kpi_dashboard(metrics_dict):
     Create a KPI dashboard with key healthcare metrics
     
     Parameters:
-    metrics_dict (dict): Dictionary containing key metrics
+    metrics_dict (dict or ClinicalStats): Dictionary containing key metrics, or
+        cached statistics to read them from
     
     Returns:
     matplotlib.figure.Figure: The created figure
     """
+    if isinstance(metrics_dict, ClinicalStats):
+        metrics_dict = metrics_dict.kpis
+    
     fig = plt.figure(figsize=(14, 8))
     
     # Create grid for KPI boxes